@@ -0,0 +1,2 @@
+# Makes scripts/ importable as a package (e.g. python -m scripts.dev_checks),
+# so Python's import system can cache these modules across pipeline steps.
@@ -0,0 +1,56 @@
+"""
+_llm_cache.py
+
+Tiny file-backed cache for deterministic LLM calls.
+
+Stability evaluation intentionally regenerates reports from identical inputs.
+With a low temperature the responses are near-deterministic, so repeated runs
+mostly waste tokens and latency. This module caches generated markdown on
+disk, keyed by a SHA-256 over the generation parameters and the canonical
+JSON of the metrics, so runs 2..N become a file read instead of a model call.
+
+The cache lives under .cache/llm/ and stores one markdown file per key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CACHE_DIR = Path(".cache") / "llm"
+
+
+def cache_key(
+    *,
+    model: str,
+    temperature: float,
+    max_output_tokens: int,
+    metrics: Dict[str, Any],
+) -> str:
+    """Return a stable SHA-256 key for one (config, metrics) combination."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "max_output_tokens": max_output_tokens,
+            "metrics": metrics,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached markdown for a key, or None on a miss."""
+    path = CACHE_DIR / f"{key}.md"
+    if not path.exists():
+        return None
+    return path.read_text(encoding="utf-8")
+
+
+def put(key: str, content: str) -> None:
+    """Store generated markdown under a key."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (CACHE_DIR / f"{key}.md").write_text(content, encoding="utf-8")
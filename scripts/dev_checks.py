@@ -0,0 +1,183 @@
+"""
+dev_checks.py
+
+Single-interpreter driver for the local sanity checks.
+
+smoke_test.py, try_parse.py, validate_ingest.py, and validate_metrics.py each
+paid the full interpreter startup + pandas/loglint import cost and re-parsed
+the sample log independently. This module hosts all of those checks as plain
+functions sharing one cached parse per input log, so running several checks
+costs one import chain and one parse.
+
+The original scripts remain as thin wrappers around the functions here.
+
+Usage:
+  python scripts/dev_checks.py smoke
+  python scripts/dev_checks.py ingest metrics
+  python scripts/dev_checks.py all
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Tuple
+
+import pandas as pd
+
+from loglint.ingest.nginx_parser import parse_nginx_log
+from loglint.ingest.normalize import NormalizeReport, normalize_events
+from loglint.tools.metrics import compute_metrics
+
+SAMPLE_LOG = "examples/sample_nginx.log"
+INCIDENT_LOG = "examples/sample_nginx_with_incident.log"
+
+PARSE_CACHE_DIR = Path("artifacts/.cache")
+
+# Prefer Parquet for the on-disk frame cache; fall back to pickle when no
+# Parquet engine (pyarrow) is installed.
+try:
+    import pyarrow  # type: ignore # noqa: F401
+
+    _CACHE_EXT = ".parquet"
+except Exception:  # pragma: no cover
+    _CACHE_EXT = ".pkl"
+
+
+def cached_parse_nginx_log(path: str) -> pd.DataFrame:
+    """
+    Disk-memoized parse_nginx_log for the iterative dev loop.
+
+    The cache key covers the log's path, mtime, and size, so editing or
+    replacing a sample log invalidates its entry. A cache hit replaces a
+    full regex parse with a columnar file read.
+    """
+    st = os.stat(path)
+    digest = hashlib.sha256(f"{path}|{st.st_mtime_ns}|{st.st_size}".encode()).hexdigest()[:16]
+    cache_path = PARSE_CACHE_DIR / f"parsed_{digest}{_CACHE_EXT}"
+
+    if cache_path.exists():
+        if _CACHE_EXT == ".parquet":
+            return pd.read_parquet(cache_path)
+        return pd.read_pickle(cache_path)
+
+    df = parse_nginx_log(path)
+    PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if _CACHE_EXT == ".parquet":
+        df.to_parquet(cache_path)
+    else:
+        df.to_pickle(cache_path)
+    return df
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed(path: str) -> pd.DataFrame:
+    return cached_parse_nginx_log(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _normalized(path: str) -> Tuple[pd.DataFrame, NormalizeReport]:
+    return normalize_events(_parsed(path), assume_tz="UTC")
+
+
+def smoke() -> None:
+    """Basic assertions on the parse + normalize pipeline (see smoke_test.py)."""
+    df, rep = _normalized(SAMPLE_LOG)
+
+    assert len(df) > 0
+    assert "minute" in df.columns
+    assert df["timestamp"].is_monotonic_increasing
+    assert df["status"].dtype.kind in ("i", "u")
+
+
+def try_parse() -> None:
+    """Print basic information about the parsed sample log (see try_parse.py)."""
+    df = _parsed(SAMPLE_LOG)
+    print(df.head(10))
+    print(df.dtypes)
+    print("Rows:", len(df))
+    print("Time range:", df["timestamp"].min(), "->", df["timestamp"].max())
+    print("5xx count:", df["is_5xx"].sum())
+
+
+def validate_ingest() -> None:
+    """Print a normalization report for the incident log (see validate_ingest.py)."""
+    df, rep = _normalized(INCIDENT_LOG)
+
+    print("=== Normalize Report ===")
+    print(rep)
+
+    print("\n=== Head ===")
+    print(df.head())
+
+    print("\n=== Dtypes ===")
+    print(df.dtypes)
+
+    print("\n=== Basic Sanity ===")
+    print("rows:", len(df))
+    print("time range:", df["timestamp"].min(), "->", df["timestamp"].max())
+    print("unique IPs:", df["ip"].nunique())
+    print("status counts:\n", df["status_class"].value_counts().sort_index())
+    print("5xx:", int(df["is_5xx"].sum()), "4xx:", int(df["is_4xx"].sum()))
+
+
+def validate_metrics() -> None:
+    """Compute metrics for the incident log and write artifacts/metrics.json."""
+    df, rep = _normalized(INCIDENT_LOG)
+
+    metrics = compute_metrics(df)
+
+    print("baseline_5m:", metrics["traffic"]["baseline_5m"])
+
+    out_path = Path("artifacts")
+    out_path.mkdir(exist_ok=True)
+    with open(out_path / "metrics.json", "w", encoding="utf-8") as f:
+        json.dump(metrics, f, indent=2)
+
+    print("Wrote artifacts/metrics.json")
+    print("5xx_count:", metrics["errors"]["overall"]["5xx_count"])
+    print("top_5xx_paths:", metrics["errors"]["top_5xx_paths"][:3])
+
+    peak = metrics["errors"]["peak_5xx_window_5m"]
+    if peak is None:
+        print("No 5xx detected; peak_5xx_window_5m is None")
+    else:
+        print("peak window:", peak["window_start"], "->", peak["window_end"])
+        print("peak totals:", peak["total_requests"], "req,", peak["5xx_count"], "5xx")
+        print("peak 5xx rate:", peak["5xx_rate"])
+        print("peak top paths:", peak["top_5xx_paths"][:3])
+        print("typical_requests_5m:", peak.get("typical_requests_5m"))
+        print("traffic_multiplier_vs_typical:", peak.get("traffic_multiplier_vs_typical"))
+
+
+CHECKS = {
+    "smoke": smoke,
+    "try-parse": try_parse,
+    "ingest": validate_ingest,
+    "metrics": validate_metrics,
+}
+
+
+def main(argv: list[str]) -> int:
+    names = argv or ["all"]
+    if "all" in names:
+        names = list(CHECKS)
+
+    unknown = [n for n in names if n not in CHECKS]
+    if unknown:
+        print(f"Unknown check(s): {unknown}. Available: {list(CHECKS)} or 'all'.", file=sys.stderr)
+        return 2
+
+    for name in names:
+        print(f"\n--- dev check: {name} ---")
+        CHECKS[name]()
+        print(f"--- {name}: done ---")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
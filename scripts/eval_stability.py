@@ -21,19 +21,32 @@ This script is CI-friendly: it exits non-zero if any required invariant fails.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
+
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loglint.agents.draft_report import DraftReportConfig, generate_draft_report
+
+import _llm_cache
 
 
 ARTIFACTS_DIR = Path("artifacts")
 METRICS_PATH = ARTIFACTS_DIR / "metrics.json"
 REPORT_PATH = ARTIFACTS_DIR / "draft_report.md"
 
+# Schema parsing patterns: '## <title>' lines and leading '1. ' / '1) ' numbering.
+_H2_RE = re.compile(r"^##\s+(.+?)\s*$")
+_NUM_PREFIX_RE = re.compile(r"^\d+\s*[\.\)]\s*")
+
 
 # --- Helpers ---------------------------------------------------------------
 
@@ -46,12 +59,25 @@ def _read_json(path: Path) -> Dict:
 
 
 def _run(cmd: List[str]) -> None:
-    """Run a command and raise if it fails."""
-    res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if res.returncode != 0:
-        raise RuntimeError(
-            f"Command failed: {' '.join(cmd)}\n\nSTDOUT:\n{res.stdout}\n\nSTDERR:\n{res.stderr}"
-        )
+    """
+    Run a command and raise (with its output) if it fails.
+
+    Output is captured into temp files rather than PIPEs: the text is only
+    needed on the error path, and a chatty generator spills to disk instead
+    of accumulating unbounded bytes in this process. (Spooled files would
+    not help here — subprocess.run calls fileno(), which forces an
+    immediate roll to disk anyway.)
+    """
+    with tempfile.TemporaryFile(mode="w+") as outbuf, \
+            tempfile.TemporaryFile(mode="w+") as errbuf:
+        res = subprocess.run(cmd, stdout=outbuf, stderr=errbuf)
+        if res.returncode != 0:
+            outbuf.seek(0)
+            errbuf.seek(0)
+            raise RuntimeError(
+                f"Command failed: {' '.join(cmd)}\n\n"
+                f"STDOUT:\n{outbuf.read()}\n\nSTDERR:\n{errbuf.read()}"
+            )
 
 
 def _extract_required_headings_from_schema(schema_text: str) -> List[str]:
@@ -66,18 +92,22 @@ def _extract_required_headings_from_schema(schema_text: str) -> List[str]:
     """
     headings: List[str] = []
     for line in schema_text.splitlines():
-        line = line.strip()
-        if line.startswith("## "):
-            title = line.replace("## ", "").strip()
+        m = _H2_RE.match(line.strip())
+        if m:
             # Strip leading numbering like "1. " or "1) "
-            title = re.sub(r"^\d+\s*[\.\)]\s*", "", title).strip()
-            headings.append(title)
+            headings.append(_NUM_PREFIX_RE.sub("", m.group(1)).strip())
 
     # If schema has a top title like "# ...", ignore it by only using ## headings.
     # Also avoid including a schema header if you have one.
     return [h for h in headings if h.lower() not in {"report schema", "incident report schema"}]
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_heading_pattern(title: str) -> re.Pattern:
+    """Compile (once per title) the pattern used by _heading_present."""
+    return re.compile(rf"^##\s+(?:\d+\s*[\.\)]\s+)?{re.escape(title)}\s*$", re.MULTILINE)
+
+
 def _heading_present(report_md: str, title: str) -> bool:
     """
     Check whether a heading appears in the report.
@@ -87,32 +117,33 @@ def _heading_present(report_md: str, title: str) -> bool:
       ## 1. Title
       ## 1) Title
     """
-    pattern = rf"^##\s+(?:\d+\s*[\.\)]\s+)?{re.escape(title)}\s*$"
-    return re.search(pattern, report_md, flags=re.MULTILINE) is not None
+    return _compile_heading_pattern(title).search(report_md) is not None
 
 
 def _contains_exact(report_md: str, needle: str) -> bool:
     return needle in report_md
 
 
-def _contains_percent_equivalent(report_md: str, rate_decimal: float) -> bool:
+def _percent_equivalent_pattern(rate_decimal: float) -> re.Pattern:
     """
-    Accept either:
+    Build one pattern matching any accepted representation of the rate:
       - the raw decimal (e.g., 0.482456)
-      - a percent with rounding (e.g., 48.25%)
-    """
-    # Raw decimal check (allow a few decimal representations)
-    dec_str = f"{rate_decimal:.6f}".rstrip("0").rstrip(".")
-    if dec_str and dec_str in report_md:
-        return True
+      - a percent with common rounding (e.g., 48%, 48.2%, 48.25%)
 
+    A single alternation means one scan over the report instead of one scan
+    per candidate string; the rate is invariant across runs so the compiled
+    pattern can be reused for every run.
+    """
+    # Percent forms first: reports far more often quote '48.25%' than the raw
+    # decimal, and the regex alternation tries branches in order.
+    candidates: List[str] = []
     pct = rate_decimal * 100.0
-    # Accept common rounding levels: 0, 1, 2 decimal places
-    for dp in (0, 1, 2):
-        pct_str = f"{pct:.{dp}f}%"
-        if pct_str in report_md:
-            return True
-    return False
+    for dp in (2, 1, 0):
+        candidates.append(f"{pct:.{dp}f}%")
+    dec_str = f"{rate_decimal:.6f}".rstrip("0").rstrip(".")
+    if dec_str:
+        candidates.append(dec_str)
+    return re.compile("|".join(re.escape(c) for c in candidates))
 
 
 @dataclass
@@ -128,36 +159,42 @@ class RunResult:
 
 def evaluate_once(
     *,
-    schema_path: Path,
-    generator_cmd: List[str],
+    required_headings: List[str],
+    generate_report: Callable[[Path], None],
+    report_out_path: Path,
     peak_window_start: str,
     peak_window_end: str,
-    peak_5xx_rate: float,
+    peak_rate_pattern: re.Pattern,
     hotspot_path: Optional[str],
+    fail_fast: bool = False,
 ) -> RunResult:
     errors: List[str] = []
 
-    # Generate report (writes artifacts/draft_report.md)
+    # Generate report (writes report_out_path)
     try:
-        _run(generator_cmd)
+        generate_report(report_out_path)
     except Exception as e:
         return RunResult(ok=False, structure_ok=False, facts_ok=False, hotspot_ok=False, errors=[str(e)])
 
-    if not REPORT_PATH.exists():
+    if not report_out_path.exists():
         return RunResult(
             ok=False, structure_ok=False, facts_ok=False, hotspot_ok=False,
-            errors=[f"Missing report artifact: {REPORT_PATH}"]
+            errors=[f"Missing report artifact: {report_out_path}"]
         )
 
-    report_md = _read_text(REPORT_PATH)
-    schema_text = _read_text(schema_path)
+    report_md = _read_text(report_out_path)
 
     # Structure invariants
-    required_headings = _extract_required_headings_from_schema(schema_text)
     missing = [h for h in required_headings if not _heading_present(report_md, h)]
     structure_ok = len(missing) == 0
     if not structure_ok:
         errors.append(f"Missing required headings: {missing}")
+        if fail_fast:
+            # Skip the remaining scans; the run already fails.
+            errors.append("fact/hotspot checks skipped (fail-fast)")
+            return RunResult(
+                ok=False, structure_ok=False, facts_ok=False, hotspot_ok=False, errors=errors
+            )
 
     # Fact invariants: exact peak window timestamps + 5xx rate presence
     facts_ok = True
@@ -167,7 +204,7 @@ def evaluate_once(
     if not _contains_exact(report_md, peak_window_end):
         facts_ok = False
         errors.append(f"Report missing exact peak window end: {peak_window_end}")
-    if not _contains_percent_equivalent(report_md, peak_5xx_rate):
+    if peak_rate_pattern.search(report_md) is None:
         facts_ok = False
         errors.append("Report missing peak 5xx rate (decimal or percent equivalent)")
 
@@ -194,8 +231,26 @@ def main() -> int:
     parser.add_argument(
         "--generator-cmd",
         type=str,
-        default="python scripts/generate_report.py",
-        help="Command to generate the report (writes artifacts/draft_report.md)."
+        default=None,
+        help=(
+            "Optional command to generate the report (writes artifacts/draft_report.md). "
+            "By default, reports are generated in-process to avoid paying interpreter "
+            "startup + import cost once per run."
+        ),
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        default=bool(os.getenv("CI")),
+        help=(
+            "Stop checking a run after its first invariant failure "
+            "(default: on when the CI env var is set)."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk LLM response cache (force a fresh generation per run).",
     )
     args = parser.parse_args()
 
@@ -208,6 +263,9 @@ def main() -> int:
         print(f"ERROR: missing schema file {schema_path}", file=sys.stderr)
         return 2
 
+    # The schema is invariant across runs; parse it once up front.
+    required_headings = _extract_required_headings_from_schema(_read_text(schema_path))
+
     metrics = _read_json(METRICS_PATH)
     peak = metrics["errors"]["peak_5xx_window_5m"]
     if not peak:
@@ -217,6 +275,7 @@ def main() -> int:
     peak_start = peak["window_start"]
     peak_end = peak["window_end"]
     peak_rate = float(peak.get("5xx_rate", 0.0))
+    peak_rate_pattern = _percent_equivalent_pattern(peak_rate)
 
     hotspot_path: Optional[str] = None
     top_paths = peak.get("top_5xx_paths") or metrics["errors"].get("top_5xx_paths") or []
@@ -224,19 +283,56 @@ def main() -> int:
         # list entries are usually {"value": "/api/login", "count": 42}
         hotspot_path = top_paths[0].get("value")
 
-    generator_cmd = args.generator_cmd.split()
-
-    results: List[RunResult] = []
-    for i in range(args.runs):
-        r = evaluate_once(
-            schema_path=schema_path,
-            generator_cmd=generator_cmd,
-            peak_window_start=peak_start,
-            peak_window_end=peak_end,
-            peak_5xx_rate=peak_rate,
-            hotspot_path=hotspot_path,
+    if args.generator_cmd:
+        # Escape hatch: run an external generator command per run.
+        generator_cmd = args.generator_cmd.split()
+
+        def generate_report(out_path: Path) -> None:
+            _run(generator_cmd + ["--out", str(out_path)])
+    else:
+        # Default: generate in-process, reusing the already-loaded metrics.
+        # This pays the interpreter + import cost once instead of once per run.
+        cfg = DraftReportConfig()
+        use_cache = not args.no_cache
+        key = _llm_cache.cache_key(
+            model=cfg.model,
+            temperature=cfg.temperature,
+            max_output_tokens=cfg.max_output_tokens,
+            metrics=metrics,
         )
-        results.append(r)
+
+        def generate_report(out_path: Path) -> None:
+            report_md = _llm_cache.get(key) if use_cache else None
+            if report_md is None:
+                report_md = generate_draft_report(
+                    metrics, config=cfg, use_cache=use_cache
+                )
+                if use_cache:
+                    _llm_cache.put(key, report_md)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(report_md + "\n", encoding="utf-8")
+
+    # Each run writes to its own temp path, so the N runs are independent and
+    # can overlap their LLM/network latency on a thread pool.
+    with tempfile.TemporaryDirectory(prefix="loglint_stability_") as tmpdir:
+        tmp = Path(tmpdir)
+
+        def run_one(i: int) -> RunResult:
+            return evaluate_once(
+                required_headings=required_headings,
+                generate_report=generate_report,
+                report_out_path=tmp / f"r{i}.md",
+                peak_window_start=peak_start,
+                peak_window_end=peak_end,
+                peak_rate_pattern=peak_rate_pattern,
+                hotspot_path=hotspot_path,
+                fail_fast=args.fail_fast,
+            )
+
+        with ThreadPoolExecutor(max_workers=args.runs) as ex:
+            results: List[RunResult] = list(ex.map(run_one, range(args.runs)))
+
+    for i, r in enumerate(results):
         status = "OK" if r.ok else "FAIL"
         print(f"[run {i+1}/{args.runs}] {status}")
 
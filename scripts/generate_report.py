@@ -16,6 +16,7 @@ This script provides a single, repeatable command for producing an
 incident-style report from log-derived metrics.
 """
 
+import argparse
 import json
 from pathlib import Path
 
@@ -26,6 +27,16 @@ OUT_PATH = Path("artifacts/draft_report.md")
 
 
 def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--out",
+        type=Path,
+        default=OUT_PATH,
+        help=f"Output path for the report markdown (default: {OUT_PATH}).",
+    )
+    args = ap.parse_args()
+    out_path: Path = args.out
+
     if not METRICS_PATH.exists():
         raise FileNotFoundError(
             f"Missing {METRICS_PATH}. Run metrics generation first (scripts/validate_metrics.py)."
@@ -42,11 +53,11 @@ def main() -> None:
 
     report_md = generate_draft_report(metrics, config=cfg)
 
-    OUT_PATH.parent.mkdir(exist_ok=True)
-    OUT_PATH.write_text(report_md + "\n", encoding="utf-8")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(report_md + "\n", encoding="utf-8")
 
     peak = metrics.get("errors", {}).get("peak_5xx_window_5m", None)
-    print(f"Wrote {OUT_PATH}")
+    print(f"Wrote {out_path}")
     if peak:
         print("Peak window:", peak.get("window_start"), "->", peak.get("window_end"))
         print("5xx_rate:", peak.get("5xx_rate"), "5xx_count:", peak.get("5xx_count"))
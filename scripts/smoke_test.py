@@ -13,19 +13,10 @@ It is meant to catch obvious issues early, such as:
 - invalid or unsorted timestamps
 - incorrect data types for key fields
 
-The test is lightweight and can be run locally without any external
-dependencies. It helps ensure that core ingestion logic remains stable as
-the project evolves.
+The check itself lives in dev_checks.py so that running several sanity
+checks shares one interpreter and one parse of the sample log.
 """
 
+from dev_checks import smoke
 
-from loglint.ingest.nginx_parser import parse_nginx_log
-from loglint.ingest.normalize import normalize_events
-
-df = parse_nginx_log("examples/sample_nginx.log")
-df, rep = normalize_events(df)
-
-assert len(df) > 0
-assert "minute" in df.columns
-assert df["timestamp"].is_monotonic_increasing
-assert df["status"].dtype.kind in ("i", "u")
+smoke()
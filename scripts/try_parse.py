@@ -10,15 +10,9 @@ The goal is to verify that:
 - the dataset looks reasonable before building metrics or AI logic
 
 This script is for local development and debugging only and is not
-part of the main AI pipeline.
+part of the main AI pipeline. The check itself lives in dev_checks.py.
 """
 
+from dev_checks import try_parse
 
-from loglint.ingest.nginx_parser import parse_nginx_log
-
-df = parse_nginx_log("examples/sample_nginx.log")
-print(df.head(10))
-print(df.dtypes)
-print("Rows:", len(df))
-print("Time range:", df["timestamp"].min(), "->", df["timestamp"].max())
-print("5xx count:", df["is_5xx"].sum())
+try_parse()
@@ -24,16 +24,19 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import sys
-from dataclasses import dataclass
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 
 @dataclass
 class Step:
     name: str
     cmd: List[str]
+    depends_on: List[str] = field(default_factory=list)
 
 
 def run_step(step: Step) -> None:
@@ -54,11 +57,26 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    # Steps form a small DAG: ingest and metrics validation only need the
+    # sample log, while the report chain depends on artifacts/metrics.json.
+    # Independent nodes run concurrently; wall time follows the critical path.
     steps: List[Step] = [
-        Step("Ingest validation", ["python", "scripts/validate_ingest.py"]),
-        Step("Metrics validation", ["python", "scripts/validate_metrics.py"]),
-        Step("Report generation", ["python", "scripts/generate_report.py"]),
-        Step("Report validation", ["python", "scripts/validate_report.py"]),
+        # One interpreter for both checks: dev_checks shares the import chain
+        # and a cached parse of the sample log between them.
+        Step(
+            "Ingest + metrics validation",
+            ["python", "scripts/dev_checks.py", "ingest", "metrics"],
+        ),
+        Step(
+            "Report generation",
+            ["python", "scripts/generate_report.py"],
+            depends_on=["Ingest + metrics validation"],
+        ),
+        Step(
+            "Report validation",
+            ["python", "scripts/validate_report.py"],
+            depends_on=["Report generation"],
+        ),
     ]
 
     if not args.skip_stability:
@@ -66,20 +84,46 @@ def main() -> int:
             Step(
                 "Stability evaluation",
                 ["python", "scripts/eval_stability.py", "--runs", str(args.runs)],
+                depends_on=["Report validation"],
             )
         )
 
     failures: List[str] = []
-
-    for step in steps:
-        try:
-            run_step(step)
-            print("✅ PASS")
-        except Exception as e:
-            print("❌ FAIL")
-            print(str(e), file=sys.stderr)
-            failures.append(step.name)
-            break  # fail fast
+    pending: Dict[str, Step] = {s.name: s for s in steps}
+    completed: set = set()
+    running: Dict[Future, str] = {}
+
+    # Ready-queue scheduler: submit any step whose dependencies completed,
+    # wait for the first finisher, repeat. On failure, stop submitting new
+    # steps (fail fast) but let in-flight steps finish.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        while pending or running:
+            if not failures:
+                ready = [
+                    s for s in pending.values()
+                    if all(dep in completed for dep in s.depends_on)
+                ]
+                for s in ready:
+                    running[ex.submit(run_step, s)] = s.name
+                    del pending[s.name]
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = running.pop(fut)
+                exc = fut.exception()
+                if exc is None:
+                    completed.add(name)
+                    print(f"✅ PASS ({name})")
+                else:
+                    print(f"❌ FAIL ({name})")
+                    print(str(exc), file=sys.stderr)
+                    failures.append(name)
+
+            if failures:
+                pending.clear()  # fail fast: do not start dependent steps
 
     print("\n=== Summary ===")
     if not failures:
@@ -20,10 +20,6 @@ from loglint.evals.structure_check import check_report_structure
 METRICS_PATH = Path("artifacts/metrics.json")
 REPORT_PATH = Path("artifacts/draft_report.md")
 
-report_md = REPORT_PATH.read_text(encoding="utf-8")
-metrics = json.loads(Path("artifacts/metrics.json").read_text())
-fres = check_report_facts(report_md, metrics=metrics)
-
 
 def main() -> None:
     if not METRICS_PATH.exists():
@@ -35,7 +31,8 @@ def main() -> None:
             f"Missing {REPORT_PATH}. Run report generation first (scripts/generate_report.py)."
         )
 
-    metrics = json.loads(Path("artifacts/metrics.json").read_text())
+    # Read each artifact exactly once; both checks share the same contents.
+    metrics = json.loads(METRICS_PATH.read_text(encoding="utf-8"))
     report_md = REPORT_PATH.read_text(encoding="utf-8")
 
     # 1) Structure validation
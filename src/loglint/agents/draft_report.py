@@ -19,11 +19,15 @@ described in the Phase 2 design philosophy. :contentReference[oaicite:2]{index=2
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 # If you're using the official OpenAI Python SDK (recommended), install:
 #   pip install openai
@@ -35,10 +39,52 @@ try:
 except Exception:  # pragma: no cover
     OpenAI = None  # type: ignore
 
+try:
+    from openai import AsyncOpenAI  # type: ignore
+except Exception:  # pragma: no cover
+    AsyncOpenAI = None  # type: ignore
+
+# orjson serializes in native code, several times faster than stdlib json on
+# large metrics blobs. Optional: environments without the wheel fall back to
+# stdlib with identical formatting options.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 DEFAULT_SCHEMA_PATH = Path("docs/report/report_schema.md")
 DEFAULT_RULES_PATH = Path("docs/report/grounding_rules.md")
 
+# Exact-match response cache: identical (model, temperature, prompts) reuse
+# the stored Markdown instead of re-spending tokens on an API round-trip.
+# Entries expire so stale reports don't linger across long-lived checkouts.
+RESPONSE_CACHE_DIR = Path(".cache/draft_reports")
+RESPONSE_CACHE_TTL_SECONDS = 7 * 86400
+
+
+def _response_cache_key(
+    *, model: str, temperature: float, system_prompt: str, user_prompt: str
+) -> str:
+    """Content hash of everything that determines the LLM output."""
+    raw = f"{model}|{temperature}|{system_prompt}|{user_prompt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[str]:
+    path = RESPONSE_CACHE_DIR / f"{key}.md"
+    try:
+        if time.time() - path.stat().st_mtime > RESPONSE_CACHE_TTL_SECONDS:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _response_cache_put(key: str, content: str) -> None:
+    RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (RESPONSE_CACHE_DIR / f"{key}.md").write_text(content, encoding="utf-8")
+
 
 @dataclass(frozen=True)
 class DraftReportConfig:
@@ -53,18 +99,29 @@ class DraftReportConfig:
       Prevent runaway outputs.
     schema_path / rules_path:
       Paths to the report contract and grounding rules.
+    batch_size:
+      How many metrics payloads to marshal into one LLM request in
+      generate_draft_reports_batch. 4-8 is the sweet spot; higher values
+      mostly add decode latency.
     """
     model: str = "gpt-4o-mini"
     temperature: float = 0.2
     max_output_tokens: int = 900
     schema_path: Path = DEFAULT_SCHEMA_PATH
     rules_path: Path = DEFAULT_RULES_PATH
+    batch_size: int = 4
+
+
+@functools.lru_cache(maxsize=16)
+def _read_text_cached(path_str: str, mtime_ns: int) -> str:
+    # mtime_ns participates in the cache key so edits invalidate the entry.
+    return Path(path_str).read_text(encoding="utf-8")
 
 
 def _read_text(path: Path) -> str:
     if not path.exists():
         raise FileNotFoundError(f"Missing required file: {path}")
-    return path.read_text(encoding="utf-8")
+    return _read_text_cached(str(path), path.stat().st_mtime_ns)
 
 
 def _format_metrics(metrics: Dict[str, Any]) -> str:
@@ -72,25 +129,36 @@ def _format_metrics(metrics: Dict[str, Any]) -> str:
     Render metrics in a stable, JSON-formatted block so the model has an exact
     source of truth.
     """
+    if orjson is not None:
+        return orjson.dumps(
+            metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode("utf-8")
     return json.dumps(metrics, indent=2, sort_keys=True)
 
 
-def build_prompt(*, schema: str, rules: str, metrics_json: str) -> tuple[str, str]:
+# Static across all report generations; built once at import.
+SYSTEM_PROMPT = (
+    "You are an incident report generator.\n"
+    "You produce clear, professional incident reports for engineers.\n"
+    "You MUST follow the provided report schema exactly.\n"
+    "You MUST follow the provided grounding rules exactly.\n"
+    "If a required detail is not present in the metrics JSON, you must say it is not available.\n"
+    "Do not add extra sections. Do not reorder sections."
+)
+
+
+# Line separating the N reports in a batched response (see
+# generate_draft_reports_batch). Chosen to never occur in normal Markdown.
+REPORT_BOUNDARY = "<<<REPORT_BOUNDARY>>>"
+
+
+def _instruction_block(*, schema: str, rules: str) -> str:
     """
-    Returns (system_prompt, user_prompt).
-    We keep the contract (schema + rules) in the prompt so the LLM has no excuse
-    to improvise structure or invent facts.
+    The full instruction prefix shared by single and batched prompts:
+    contract, grounding rules, and every formatting constraint. Static for a
+    given schema/rules pair, so providers can prompt-cache it.
     """
-    system_prompt = (
-        "You are an incident report generator.\n"
-        "You produce clear, professional incident reports for engineers.\n"
-        "You MUST follow the provided report schema exactly.\n"
-        "You MUST follow the provided grounding rules exactly.\n"
-        "If a required detail is not present in the metrics JSON, you must say it is not available.\n"
-        "Do not add extra sections. Do not reorder sections."
-    )
-
-    user_prompt = (
+    return (
         "## Report Schema (contract)\n"
         f"{schema}\n\n"
         "## Grounding Rules (must obey)\n"
@@ -108,10 +176,6 @@ def build_prompt(*, schema: str, rules: str, metrics_json: str) -> tuple[str, st
     	"- Do NOT infer traffic changes (e.g., 'increased traffic') unless a baseline comparison is explicitly provided in metrics.json.\n"
     	"- Do NOT describe endpoints as 'user-facing' or infer business impact.\n"
     	"- If required information is not available, state 'Not available from metrics.'\n\n"
-        "## Metrics JSON (only source of factual truth)\n"
-        "```json\n"
-        f"{metrics_json}\n"
-        "```\n\n"
 	"CRITICAL FORMAT RULES:\n"
         "- Use the section headings EXACTLY as shown below (character-for-character).\n"
         "- Do NOT add numbering like '1.', '2.', etc.\n"
@@ -151,10 +215,57 @@ def build_prompt(*, schema: str, rules: str, metrics_json: str) -> tuple[str, st
 	"- If you mention a rate, label it clearly as either 'peak window' or 'overall', and use the exact value from metrics.json.\n"
 	"- Do NOT claim traffic increased/decreased unless metrics.json explicitly provides a baseline comparison.\n"
 	"- Do NOT describe endpoints as 'user-facing' or infer business impact. Only describe observed failures and where they occurred.\n"
-	"- If a detail is not present in metrics.json, write 'Not available from metrics.'\n"
+	"- If a detail is not present in metrics.json, write 'Not available from metrics.'\n\n"
+    )
+
+
+def build_prompt(*, schema: str, rules: str, metrics_json: str) -> tuple[str, str]:
+    """
+    Returns (system_prompt, user_prompt).
+    We keep the contract (schema + rules) in the prompt so the LLM has no excuse
+    to improvise structure or invent facts.
+
+    Ordering matters for cost: provider prompt caches hash the prompt prefix,
+    so every static block (schema, rules, formatting constraints) comes first
+    and the per-request metrics JSON is appended last. That keeps the entire
+    instruction prefix cacheable across report generations.
+    """
+    user_prompt = (
+        _instruction_block(schema=schema, rules=rules)
+        + "## Metrics JSON (only source of factual truth)\n"
+        "```json\n"
+        f"{metrics_json}\n"
+        "```\n"
     )
 
-    return system_prompt, user_prompt
+    return SYSTEM_PROMPT, user_prompt
+
+
+def build_batch_prompt(
+    *, schema: str, rules: str, metrics_jsons: List[str]
+) -> tuple[str, str]:
+    """
+    Returns (system_prompt, user_prompt) asking for one report per metrics
+    block, in input order, separated by REPORT_BOUNDARY lines. Shares the
+    cacheable instruction prefix with build_prompt.
+    """
+    parts = [_instruction_block(schema=schema, rules=rules)]
+    parts.append(
+        "BATCH MODE:\n"
+        f"- You are given {len(metrics_jsons)} independent metrics payloads below.\n"
+        "- Emit one complete incident report per payload, in input order.\n"
+        f"- Separate consecutive reports with a line containing exactly: {REPORT_BOUNDARY}\n"
+        "- Do NOT emit that separator before the first report or after the last.\n"
+        "- Never mix facts between payloads; each report uses only its own metrics JSON.\n\n"
+    )
+    for i, metrics_json in enumerate(metrics_jsons, start=1):
+        parts.append(
+            f"## Metrics JSON [{i}] (only source of factual truth for report {i})\n"
+            "```json\n"
+            f"{metrics_json}\n"
+            "```\n\n"
+        )
+    return SYSTEM_PROMPT, "".join(parts)
 
 
 def call_llm_openai(
@@ -199,10 +310,49 @@ def call_llm_openai(
     return content.strip()
 
 
+async def call_llm_openai_async(
+    *,
+    system_prompt: str,
+    user_prompt: str,
+    config: DraftReportConfig,
+) -> str:
+    """
+    Async variant of call_llm_openai. The await only holds the event loop
+    while the response is outstanding, so many generations can be in flight
+    at once (see generate_many).
+    """
+    if AsyncOpenAI is None:
+        raise RuntimeError(
+            "OpenAI SDK is not installed. Run: pip install openai"
+        )
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is not set in your environment.")
+
+    client = AsyncOpenAI(api_key=api_key)
+
+    resp = await client.chat.completions.create(
+        model=config.model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        temperature=config.temperature,
+        max_tokens=config.max_output_tokens,
+    )
+
+    content = resp.choices[0].message.content
+    if not content:
+        raise RuntimeError("LLM returned empty content.")
+    return content.strip()
+
+
 def generate_draft_report(
     metrics: Dict[str, Any],
     *,
     config: Optional[DraftReportConfig] = None,
+    use_cache: bool = True,
 ) -> str:
     """
     Generate a draft incident report (Markdown) from computed metrics.
@@ -210,8 +360,12 @@ def generate_draft_report(
     This function:
       1) loads schema + grounding rules from docs/
       2) embeds them + metrics JSON into a strict prompt
-      3) calls the LLM with low temperature
-      4) returns Markdown report text
+      3) returns a cached response if the exact prompt was seen before
+      4) otherwise calls the LLM with low temperature
+      5) returns Markdown report text
+
+    Set use_cache=False to force a fresh LLM call (e.g. when measuring
+    run-to-run output stability).
     """
     cfg = config or DraftReportConfig()
 
@@ -225,8 +379,158 @@ def generate_draft_report(
         metrics_json=metrics_json,
     )
 
-    return call_llm_openai(
+    key = _response_cache_key(
+        model=cfg.model,
+        temperature=cfg.temperature,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+    )
+    if use_cache:
+        cached = _response_cache_get(key)
+        if cached is not None:
+            return cached
+
+    content = call_llm_openai(
         system_prompt=system_prompt,
         user_prompt=user_prompt,
         config=cfg,
     )
+    if use_cache:
+        _response_cache_put(key, content)
+    return content
+
+
+async def generate_draft_report_async(
+    metrics: Dict[str, Any],
+    *,
+    config: Optional[DraftReportConfig] = None,
+    use_cache: bool = True,
+) -> str:
+    """
+    Async variant of generate_draft_report: same prompt, cache, and output,
+    but awaitable so callers can overlap many generations.
+    """
+    cfg = config or DraftReportConfig()
+
+    schema = _read_text(cfg.schema_path)
+    rules = _read_text(cfg.rules_path)
+    metrics_json = _format_metrics(metrics)
+
+    system_prompt, user_prompt = build_prompt(
+        schema=schema,
+        rules=rules,
+        metrics_json=metrics_json,
+    )
+
+    key = _response_cache_key(
+        model=cfg.model,
+        temperature=cfg.temperature,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+    )
+    if use_cache:
+        cached = _response_cache_get(key)
+        if cached is not None:
+            return cached
+
+    content = await call_llm_openai_async(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        config=cfg,
+    )
+    if use_cache:
+        _response_cache_put(key, content)
+    return content
+
+
+async def generate_many(
+    metrics_list: List[Dict[str, Any]],
+    *,
+    config: Optional[DraftReportConfig] = None,
+    concurrency: int = 16,
+    use_cache: bool = True,
+) -> List[str]:
+    """
+    Generate reports for many metrics dicts with up to `concurrency` LLM
+    requests in flight. Results come back in input order.
+
+    Generation time is dominated by network + decode latency, so overlapping
+    requests scales throughput nearly linearly until the provider's rate
+    limits bite.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(metrics: Dict[str, Any]) -> str:
+        async with sem:
+            return await generate_draft_report_async(
+                metrics, config=config, use_cache=use_cache
+            )
+
+    return list(await asyncio.gather(*(one(m) for m in metrics_list)))
+
+
+def generate_draft_reports_batch(
+    metrics_list: List[Dict[str, Any]],
+    *,
+    config: Optional[DraftReportConfig] = None,
+    use_cache: bool = True,
+) -> List[str]:
+    """
+    Generate reports for several metrics dicts, marshaling config.batch_size
+    payloads into each LLM request.
+
+    One request carrying N payloads amortizes the large static instruction
+    prefix and counts once against request-rate limits. The model separates
+    reports with REPORT_BOUNDARY lines; if a batch comes back with the wrong
+    number of reports, that batch falls back to one call per payload.
+    """
+    cfg = config or DraftReportConfig()
+    if cfg.batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {cfg.batch_size}")
+
+    schema = _read_text(cfg.schema_path)
+    rules = _read_text(cfg.rules_path)
+
+    reports: List[str] = []
+    for start in range(0, len(metrics_list), cfg.batch_size):
+        batch = metrics_list[start : start + cfg.batch_size]
+        if len(batch) == 1:
+            reports.append(
+                generate_draft_report(batch[0], config=cfg, use_cache=use_cache)
+            )
+            continue
+
+        system_prompt, user_prompt = build_batch_prompt(
+            schema=schema,
+            rules=rules,
+            metrics_jsons=[_format_metrics(m) for m in batch],
+        )
+        key = _response_cache_key(
+            model=cfg.model,
+            temperature=cfg.temperature,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+        content = _response_cache_get(key) if use_cache else None
+        if content is None:
+            content = call_llm_openai(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                config=cfg,
+            )
+            if use_cache:
+                _response_cache_put(key, content)
+
+        split = [part.strip() for part in content.split(REPORT_BOUNDARY)]
+        if len(split) == len(batch):
+            reports.extend(split)
+        else:
+            # Miscounted boundaries: regenerate this batch one payload at a
+            # time rather than misattribute reports.
+            reports.extend(
+                generate_draft_report(m, config=cfg, use_cache=use_cache)
+                for m in batch
+            )
+    return reports
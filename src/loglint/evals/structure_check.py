@@ -32,31 +32,30 @@ REQUIRED_HEADINGS = [
     "Recommended Next Checks",
 ]
 
-def _heading_pattern(title: str) -> re.Pattern:
-    # Matches:
-    #  "## Executive Summary"
-    #  "## 1. Executive Summary"
-    #  "## 1 Executive Summary"
-    return re.compile(rf"^##\s*(?:\d+\.?\s*)?{re.escape(title)}\s*$", re.MULTILINE)
+# One combined alternation, compiled once at import. Matches any required
+# heading in the tolerant forms:
+#  "## Executive Summary"
+#  "## 1. Executive Summary"
+#  "## 1 Executive Summary"
+# A single finditer pass collects every heading position, instead of two
+# full-document searches per title.
+_HEADING_RE = re.compile(
+    rf"^##\s*(?:\d+\.?\s*)?({'|'.join(re.escape(t) for t in REQUIRED_HEADINGS)})\s*$",
+    re.MULTILINE,
+)
 
 def check_report_structure(report_md: str) -> StructureCheckResult:
     errors: List[str] = []
-    positions = {}
+    positions: dict[str, List[int]] = {title: [] for title in REQUIRED_HEADINGS}
 
-    for title in REQUIRED_HEADINGS:
-        pat = _heading_pattern(title)
-        match = pat.search(report_md)
+    for match in _HEADING_RE.finditer(report_md):
+        positions[match.group(1)].append(match.start())
 
-        if not match:
+    for title in REQUIRED_HEADINGS:
+        found = positions[title]
+        if not found:
             errors.append(f"Missing required heading: ## {title}")
-            continue
-
-        # Record position for ordering check
-        positions[title] = match.start()
-
-        # Check for duplicates
-        second_match = pat.search(report_md, match.end())
-        if second_match:
+        elif len(found) > 1:
             errors.append(f"Heading appears more than once: ## {title}")
 
     # If missing or duplicate headings, ordering check is meaningless
@@ -64,12 +63,8 @@ def check_report_structure(report_md: str) -> StructureCheckResult:
         return StructureCheckResult(ok=False, errors=errors)
 
     # Check ordering
-    last_pos = -1
-    for title in REQUIRED_HEADINGS:
-        pos = positions[title]
-        if pos < last_pos:
-            errors.append("Headings are out of order.")
-            break
-        last_pos = pos
+    first_positions = [positions[title][0] for title in REQUIRED_HEADINGS]
+    if first_positions != sorted(first_positions):
+        errors.append("Headings are out of order.")
 
     return StructureCheckResult(ok=(len(errors) == 0), errors=errors)
@@ -18,14 +18,55 @@ This module contains no AI logic and is intentionally deterministic.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 
+import numpy as np
 import pandas as pd
 
 
 REQUIRED_COLUMNS = ["timestamp", "ip", "method", "path", "status", "bytes_sent"]
 
+# Private IPv4 ranges as (mask, value) pairs on the packed uint32 form:
+# 10.0.0.0/8, 192.168.0.0/16, 172.16.0.0/12.
+_PRIVATE_IPV4_RANGES = [
+    (0xFF000000, 0x0A000000),
+    (0xFFFF0000, 0xC0A80000),
+    (0xFFF00000, 0xAC100000),
+]
+
+# The same three ranges as one precompiled alternation, used only for values
+# the packed-uint32 path cannot classify (not well-formed IPv4). One combined
+# pattern means those stragglers are scanned once, not once per prefix.
+_PRIVATE_IP_PREFIX_RE = re.compile(r"^(?:10\.|192\.168\.|172\.(?:1[6-9]|2\d|3[01])\.)")
+
+
+def _pack_ipv4(ip: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack dotted-quad strings into uint32 values.
+
+    Returns (packed, valid): rows that are not well-formed IPv4 (wrong number
+    of octets, non-numeric, out of range) get valid=False and packed=0.
+    """
+    parts = ip.str.split(".", expand=True)
+    n = len(ip)
+    if parts.shape[1] < 4:
+        return np.zeros(n, dtype=np.uint32), np.zeros(n, dtype=bool)
+
+    octets = parts.iloc[:, :4].apply(pd.to_numeric, errors="coerce")
+    valid = octets.notna().all(axis=1).to_numpy().copy()
+    if parts.shape[1] > 4:  # e.g. '1.2.3.4.5'
+        valid &= parts.iloc[:, 4:].isna().all(axis=1).to_numpy()
+
+    o = octets.fillna(0).to_numpy(dtype=np.int64)
+    valid &= ((o >= 0) & (o <= 255)).all(axis=1)
+    packed = ((o[:, 0] << 24) | (o[:, 1] << 16) | (o[:, 2] << 8) | o[:, 3]).astype(
+        np.uint32
+    )
+    packed[~valid] = 0
+    return packed, valid
+
 
 @dataclass(frozen=True)
 class NormalizeReport:
@@ -60,73 +101,123 @@ def normalize_events(
     input_rows = len(df)
     dropped: Dict[str, int] = {}
 
-    out = df.copy()
-
-    # --- Type conversions ---
+    # --- Type conversions (on derived Series; the input frame is not copied) ---
     # timestamp -> tz-aware datetime
-    out["timestamp"] = pd.to_datetime(out["timestamp"], errors="coerce")
+    ts = pd.to_datetime(df["timestamp"], errors="coerce")
     # If timestamps are naive, localize them, if tz-aware, keep them.
-    if out["timestamp"].dt.tz is None:
-        out["timestamp"] = out["timestamp"].dt.tz_localize(assume_tz)
+    if ts.dt.tz is None:
+        ts = ts.dt.tz_localize(assume_tz)
 
-    # status -> int (coerce invalid to NaN then drop)
-    out["status"] = pd.to_numeric(out["status"], errors="coerce")
-    out["bytes_sent"] = pd.to_numeric(out["bytes_sent"], errors="coerce").fillna(0)
+    # status -> int (coerce invalid to NaN; NaN and out-of-range drop below)
+    status = pd.to_numeric(df["status"], errors="coerce")
+    bytes_sent = pd.to_numeric(df["bytes_sent"], errors="coerce").fillna(0)
 
     # strings: make sure they're strings and strip
-    for c in ["ip", "method", "path"]:
-        out[c] = out[c].astype(str).str.strip()
+    ip = df["ip"].astype(str).str.strip()
+    method = df["method"].astype(str).str.strip()
+    path = df["path"].astype(str).str.strip()
 
     # --- Drop malformed rows ---
-    # invalid timestamp
-    mask_bad_time = out["timestamp"].isna()
-    if mask_bad_time.any():
-        dropped["bad_timestamp"] = int(mask_bad_time.sum())
-        out = out[~mask_bad_time]
-
-    # invalid status
-    mask_bad_status = out["status"].isna()
-    if mask_bad_status.any():
-        dropped["bad_status"] = int(mask_bad_status.sum())
-        out = out[~mask_bad_status]
-
-    # empty path or method
-    mask_bad_req = (out["method"] == "") | (out["path"] == "") | (out["path"] == "None")
-    if mask_bad_req.any():
-        dropped["bad_request"] = int(mask_bad_req.sum())
-        out = out[~mask_bad_req]
-
-    # coerce numeric types after dropping
-    out["status"] = out["status"].astype(int)
-    out["bytes_sent"] = out["bytes_sent"].astype(int)
+    # All drop masks are computed up front and OR-ed into one keep mask, so the
+    # frame is filtered once instead of re-sliced per reason (the old
+    # copy-then-chain version rewrote every column once per filter). Each
+    # reason is counted against rows not already dropped by an earlier check,
+    # preserving the sequential-filter accounting. The mask algebra runs on
+    # plain numpy arrays: combining Series would realign indexes on every
+    # operator for no benefit here.
+    mask_bad_time = ts.isna().to_numpy()
+    # between() is False for NaN, so this covers unparseable values too; the
+    # HTTP range also guards the int16 downcast below — a caller-supplied
+    # status like 99999 is dropped and counted instead of silently wrapping.
+    mask_bad_status = (~status.between(100, 599)).to_numpy()
+    mask_bad_req = (
+        (method == "").to_numpy() | (path == "").to_numpy() | (path == "None").to_numpy()
+    )
+
+    n_bad_time = int(mask_bad_time.sum())
+    if n_bad_time:
+        dropped["bad_timestamp"] = n_bad_time
+    n_bad_status = int((mask_bad_status & ~mask_bad_time).sum())
+    if n_bad_status:
+        dropped["bad_status"] = n_bad_status
+    n_bad_req = int((mask_bad_req & ~mask_bad_time & ~mask_bad_status).sum())
+    if n_bad_req:
+        dropped["bad_request"] = n_bad_req
+
+    keep = ~(mask_bad_time | mask_bad_status | mask_bad_req)
 
     # Optional: drop private IPs (not necessary for MVP)
     if drop_private_ips:
-        # Simple heuristic: 10.*, 192.168.*, 172.16-31.*
-        private = (
-            out["ip"].str.startswith("10.")
-            | out["ip"].str.startswith("192.168.")
-            | out["ip"].str.match(r"^172\.(1[6-9]|2\d|3[0-1])\.")
-        )
-        if private.any():
-            dropped["private_ip"] = int(private.sum())
-            out = out[~private]
+        # 10/8, 192.168/16, 172.16/12 as bitmask compares on packed uint32 —
+        # a few integer compares instead of per-row string scans. Values that
+        # are not well-formed IPv4 are never treated as private.
+        packed, valid_ipv4 = _pack_ipv4(ip)
+        private = np.zeros(len(ip), dtype=bool)
+        for mask, value in _PRIVATE_IPV4_RANGES:
+            private |= (packed & mask) == value
+        private &= valid_ipv4
+        if not valid_ipv4.all():
+            # Rare stragglers (malformed octets, truncated values): match the
+            # combined prefix pattern in one pass over just those rows, which
+            # also keeps the old string-heuristic behavior for them.
+            irregular = ~valid_ipv4
+            private[irregular] = (
+                ip[irregular].str.match(_PRIVATE_IP_PREFIX_RE).to_numpy()
+            )
+        n_private = int((private & keep).sum())
+        if n_private:
+            dropped["private_ip"] = n_private
+        keep &= ~private
+
+    # Single gather: one new frame, with the cleaned/typed columns assigned in.
+    out = df.loc[keep].assign(
+        timestamp=ts[keep],
+        ip=ip[keep],
+        method=method[keep],
+        path=path[keep],
+        status=status[keep].astype(np.int16),
+        bytes_sent=bytes_sent[keep].astype(np.int64),
+    )
 
     # --- Deduplicate (optional but helpful) ---
-    # Not strictly required, kept simple:
-    before = len(out)
-    out = out.drop_duplicates(subset=["timestamp", "ip", "method", "path", "status", "bytes_sent"])
-    dupes_dropped = before - len(out)
+    # One vectorized uint64 row-hash instead of drop_duplicates over six
+    # heterogeneous columns (which materializes a temporary key frame);
+    # duplicated() on the hashes then keeps the first occurrence as before.
+    row_hash = pd.util.hash_pandas_object(
+        out[["timestamp", "ip", "method", "path", "status", "bytes_sent"]],
+        index=False,
+    )
+    unique_mask = ~row_hash.duplicated().to_numpy()
+    dupes_dropped = int(len(out) - unique_mask.sum())
     if dupes_dropped:
          dropped["duplicates"] = dupes_dropped
+         out = out.loc[unique_mask]
+
+    # --- Dictionary-encode low-cardinality strings ---
+    # Access logs repeat the same handful of methods/paths millions of times;
+    # category dtype stores one small dictionary plus integer codes, shrinking
+    # memory and turning downstream groupby/value_counts into integer ops.
+    # ip can be high-cardinality (scans, CDNs), so only encode it when it
+    # actually repeats enough to pay off.
+    out["method"] = out["method"].astype("category")
+    out["path"] = out["path"].astype("category")
+    if len(out) and out["ip"].nunique() / len(out) < 0.5:
+        out["ip"] = out["ip"].astype("category")
     # --- Derived columns for metrics ---
-    out["status_class"] = (out["status"] // 100) * 100  # 200, 300, 400, 500
-    out["is_4xx"] = (out["status"] >= 400) & (out["status"] < 500)
-    out["is_5xx"] = (out["status"] >= 500) & (out["status"] < 600)
+    # status is int16, so the class math stays in int16 (no int64 upcast),
+    # and the error flags are single equality tests against the class
+    # instead of two range compares AND-ed together.
+    status_class = (out["status"].to_numpy() // np.int16(100)) * np.int16(100)
+    out["status_class"] = status_class  # 200, 300, 400, 500
+    out["is_4xx"] = status_class == 400
+    out["is_5xx"] = status_class == 500
     out["minute"] = out["timestamp"].dt.floor("min")  # time bucketing
 
-    # Sort for time-series work
-    out = out.sort_values("timestamp").reset_index(drop=True)
+    # Sort for time-series work; skipped when the parser already delivered
+    # the rows in time order (the overwhelmingly common case).
+    if not out["timestamp"].is_monotonic_increasing:
+        out = out.sort_values("timestamp", kind="mergesort")
+    out = out.reset_index(drop=True)
 
     report = NormalizeReport(
         input_rows=input_rows,
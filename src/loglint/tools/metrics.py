@@ -18,11 +18,21 @@ without guessing or inventing numbers.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from loglint.tools import metrics_duckdb, metrics_polars
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:  # pragma: no cover
+    pa = None  # type: ignore
+
 
 def _iso(ts: pd.Timestamp) -> str:
     """Convert a pandas Timestamp to an ISO 8601 string."""
@@ -33,6 +43,24 @@ def _iso(ts: pd.Timestamp) -> str:
     return ts.isoformat()
 
 
+def _iso_all(values) -> List[str]:
+    """
+    ISO 8601 strings for a whole datetime array in one vectorized pass.
+
+    _iso per element re-runs the timezone checks thousands of times for long
+    time ranges; here strftime formats the column in one C loop. strftime
+    cannot emit the colon form of the offset, so the (constant, UTC) suffix
+    is appended per string; anything with a variable offset falls back to
+    per-element isoformat.
+    """
+    idx = pd.DatetimeIndex(values)
+    if idx.tz is None:
+        idx = idx.tz_localize("UTC")
+    if str(idx.tz) == "UTC":
+        return [s + "+00:00" for s in idx.strftime("%Y-%m-%dT%H:%M:%S")]
+    return [ts.isoformat() for ts in idx]
+
+
 def _safe_div(n: int, d: int) -> float:
     """Prevents divide by zero.
        Used for error rates (ex. 4xx_count / total)
@@ -41,9 +69,37 @@ def _safe_div(n: int, d: int) -> float:
     return float(n) / float(d) if d else 0.0
 
 
+def _top_n_from_counts(cats: pd.Index, counts: np.ndarray, n: int) -> List[Dict[str, Any]]:
+    """
+    Top N categories from precomputed per-category counts.
+
+    value_counts builds a fully sorted Series over all uniques just to keep
+    ten of them; argpartition picks the winners in O(U) instead. Boundary
+    ties are widened to the threshold count and broken by category code —
+    the same order value_counts produced.
+    """
+    if len(counts) > n:
+        part = np.argpartition(-counts, n - 1)[:n]
+        cand = np.flatnonzero(counts >= counts[part].min())
+    else:
+        cand = np.flatnonzero(counts > 0)
+    order = cand[np.lexsort((cand, -counts[cand]))][:n]
+    return [{"value": cats[i], "count": int(counts[i])} for i in order if counts[i] > 0]
+
+
+def _top_n_codes(cats: pd.Index, codes: np.ndarray, n: int) -> List[Dict[str, Any]]:
+    """Top N categories by count from an array of categorical codes."""
+    counts = np.bincount(codes[codes >= 0], minlength=len(cats))
+    return _top_n_from_counts(cats, counts, n)
+
+
 def _top_n(df: pd.DataFrame, col: str, n: int = 10) -> List[Dict[str, Any]]:
     """Return top N values for a column as [{'value': ..., 'count': ...}, ...]."""
-    vc = df[col].value_counts().head(n)
+    s = df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return _top_n_codes(s.cat.categories, s.cat.codes.to_numpy(), n)
+    vc = s.value_counts()
+    vc = vc[vc > 0].head(n)
     return [{"value": idx, "count": int(cnt)} for idx, cnt in vc.items()]
 
 
@@ -62,13 +118,34 @@ def _top_n_filtered(
 # The next two are time series metrics
 # They answer "How did things change over time?"
 
+def _per_minute_counts(
+    minute: pd.Series, is4: np.ndarray, is5: np.ndarray
+) -> Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    One fused pass over the minute buckets: factorize once, then bincount
+    total/4xx/5xx on the int bucket indices. Replaces two separate groupbys
+    (requests_per_minute and errors_per_minute) that each re-hashed the same
+    minute column. Takes the error flags as flat arrays so callers that run
+    several reductions extract each column exactly once.
+
+    Returns (sorted_minutes, total, c4xx, c5xx) as parallel arrays.
+    """
+    idx, minutes = pd.factorize(minute, sort=True)
+    nb = len(minutes)
+    total = np.bincount(idx, minlength=nb)
+    c4 = np.bincount(idx, weights=is4, minlength=nb).astype(np.int64)
+    c5 = np.bincount(idx, weights=is5, minlength=nb).astype(np.int64)
+    return minutes, total, c4, c5
+
+
 def requests_per_minute(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """
     Return a time series of request counts per minute:
     [{'minute': '...', 'requests': 123}, ...]
     """
-    counts = df.groupby("minute").size().sort_index()
-    return [{"minute": _iso(idx), "requests": int(val)} for idx, val in counts.items()]
+    is4 = df["is_4xx"].to_numpy()
+    minutes, total, _, _ = _per_minute_counts(df["minute"], is4, df["is_5xx"].to_numpy())
+    return [{"minute": m, "requests": int(t)} for m, t in zip(_iso_all(minutes), total)]
 
 
 def errors_per_minute(df: pd.DataFrame) -> List[Dict[str, Any]]:
@@ -76,23 +153,27 @@ def errors_per_minute(df: pd.DataFrame) -> List[Dict[str, Any]]:
     Return a time series per minute with 4xx/5xx counts:
     [{'minute': '...', '4xx': 10, '5xx': 2, 'total': 120}, ...]
     """
-    g = df.groupby("minute").agg(
-        total=("status", "size"),
-        c4xx=("is_4xx", "sum"),
-        c5xx=("is_5xx", "sum"),
-    ).sort_index()
-
-    out: List[Dict[str, Any]] = []
-    for idx, row in g.iterrows():
-        out.append(
-            {
-                "minute": _iso(idx),
-                "total": int(row["total"]),
-                "4xx": int(row["c4xx"]),
-                "5xx": int(row["c5xx"]),
-            }
-        )
-    return out
+    minutes, total, c4, c5 = _per_minute_counts(
+        df["minute"], df["is_4xx"].to_numpy(), df["is_5xx"].to_numpy()
+    )
+    return [
+        {"minute": m, "total": int(t), "4xx": int(a), "5xx": int(b)}
+        for m, t, a, b in zip(_iso_all(minutes), total, c4, c5)
+    ]
+
+
+def _overall_from_flags(total: int, is4: np.ndarray, is5: np.ndarray) -> Dict[str, Any]:
+    # count_nonzero on the flat bool arrays: no Series reducer, no boxed
+    # intermediate — one vectorized popcount per flag.
+    c4 = int(np.count_nonzero(is4))
+    c5 = int(np.count_nonzero(is5))
+    return {
+        "total_requests": total,
+        "4xx_count": c4,
+        "5xx_count": c5,
+        "4xx_rate": round(_safe_div(c4, total), 6),
+        "5xx_rate": round(_safe_div(c5, total), 6),
+    }
 
 
 def overall_error_stats(df: pd.DataFrame) -> Dict[str, Any]:
@@ -104,16 +185,8 @@ def overall_error_stats(df: pd.DataFrame) -> Dict[str, Any]:
     So the summar can immediately start with:
 	"Overall 5xx rate was X%"
     """
-    total = int(len(df))
-    c4 = int(df["is_4xx"].sum())
-    c5 = int(df["is_5xx"].sum())
-    return {
-        "total_requests": total,
-        "4xx_count": c4,
-        "5xx_count": c5,
-        "4xx_rate": round(_safe_div(c4, total), 6),
-        "5xx_rate": round(_safe_div(c5, total), 6),
-    }
+    is4, is5 = _error_flags(df)
+    return _overall_from_flags(int(len(df)), is4, is5)
 
 # top endpoints by total traffic (regardless of status)
 def top_paths_by_volume(df: pd.DataFrame, n: int = 10) -> List[Dict[str, Any]]:
@@ -128,27 +201,117 @@ def top_ips_by_requests(df: pd.DataFrame, n: int = 10) -> List[Dict[str, Any]]:
     return _top_n(df, "ip", n=n)
 
 
-def top_ips_by_5xx(df: pd.DataFrame, n: int = 10, min_requests: int = 20) -> List[Dict[str, Any]]:
+def _ip_stats(
+    df: pd.DataFrame, is4: np.ndarray, is5: np.ndarray
+) -> Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Return IPs that generate the most 5xx responses.
-    We also apply a minimum request threshold to avoid one-off noise.
+    One pass over the categorical ip column: per-IP request/4xx/5xx counts
+    as parallel arrays indexed by category code. Lets the three client
+    top-N lists share a single scan instead of each re-counting the column.
     """
-    # total requests per ip
-    totals = df.groupby("ip").size()
+    ip = df["ip"]
+    codes = ip.cat.codes.to_numpy()
+    nb = len(ip.cat.categories)
+    requests = np.bincount(codes, minlength=nb)
+    c4 = np.bincount(codes, weights=is4, minlength=nb).astype(np.int64)
+    c5 = np.bincount(codes, weights=is5, minlength=nb).astype(np.int64)
+    return ip.cat.categories, requests, c4, c5
+
+
+def _top_error_ips(
+    df: pd.DataFrame, flag: str, n: int, min_requests: int
+) -> List[Dict[str, Any]]:
+    """Top IPs by error flag, restricted to IPs with min_requests total."""
+    ip = df["ip"]
+    if isinstance(ip.dtype, pd.CategoricalDtype):
+        # isin() on strings would hash every row; on a categorical the
+        # eligibility test is a bincount over the int codes indexed back onto
+        # the rows, and the top-N runs on the masked codes directly — no
+        # intermediate frame slice, no string hashing.
+        codes = ip.cat.codes.to_numpy()
+        counts = np.bincount(codes, minlength=len(ip.cat.categories))
+        sel = (counts >= min_requests)[codes] & df[flag].to_numpy()
+        return _top_n_codes(ip.cat.categories, codes[sel], n)
+    # observed=True skips materializing unused categories should this
+    # fallback ever see one; sort=False skips ordering group labels we only
+    # threshold against.
+    totals = df.groupby("ip", observed=True, sort=False).size()
     eligible = totals[totals >= min_requests].index
-    sub = df[df["ip"].isin(eligible) & (df["is_5xx"])]
+    sub = df[df["ip"].isin(eligible).to_numpy() & df[flag].to_numpy()]
     if sub.empty:
         return []
     return _top_n(sub, "ip", n=n)
 
 
+def top_ips_by_5xx(df: pd.DataFrame, n: int = 10, min_requests: int = 20) -> List[Dict[str, Any]]:
+    """
+    Return IPs that generate the most 5xx responses.
+    We also apply a minimum request threshold to avoid one-off noise.
+    """
+    return _top_error_ips(df, "is_5xx", n, min_requests)
+
+
 def top_ips_by_4xx(df: pd.DataFrame, n: int = 10, min_requests: int = 20) -> List[Dict[str, Any]]:
-    totals = df.groupby("ip").size()
-    eligible = totals[totals >= min_requests].index
-    sub = df[df["ip"].isin(eligible) & (df["is_4xx"])]
-    if sub.empty:
-        return []
-    return _top_n(sub, "ip", n=n)
+    return _top_error_ips(df, "is_4xx", n, min_requests)
+
+_FIVE_MIN_NS = 5 * 60 * 1_000_000_000
+
+
+def _epoch_ns(ts: pd.Series) -> np.ndarray:
+    """The timestamp column as int64 epoch nanoseconds (UTC)."""
+    # view instead of astype: the datetime64 buffer already is int64 ns
+    # under the hood, so no second copy is made. ascontiguousarray is a
+    # no-op unless the column came out of the BlockManager strided.
+    return np.ascontiguousarray(ts.to_numpy(dtype="datetime64[ns]")).view(np.int64)
+
+
+def _error_flags(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (is_4xx, is_5xx) as flat bool arrays.
+
+    normalize_events already packs the error class into one small int16
+    column (status_class), so when it is present both flags come from two
+    SIMD compares over that single column instead of pulling two separate
+    boolean columns out of the frame.
+    """
+    if "status_class" in df.columns:
+        sc = np.ascontiguousarray(df["status_class"].to_numpy())
+        return sc == 400, sc == 500
+    # Columns sliced out of a multi-column block can be strided; the fused
+    # reducers scan these arrays repeatedly, so make them dense up front
+    # (no-op when already contiguous).
+    return (
+        np.ascontiguousarray(df["is_4xx"].to_numpy()),
+        np.ascontiguousarray(df["is_5xx"].to_numpy()),
+    )
+
+
+def _window_5m_counts(
+    ts_ns: np.ndarray, is4: np.ndarray, is5: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bucket rows to 5-minute windows (integer arithmetic on raw epoch values)
+    and count total/4xx/5xx per window, factorizing the buckets once so the
+    baseline, the peak-window detector, and requests_per_5m can all share one
+    grouping instead of each re-deriving it from the timestamp column.
+
+    Returns (per_row_window_ns, window_starts_ns_sorted, total, c4xx, c5xx).
+    """
+    w_ns = (ts_ns // _FIVE_MIN_NS) * _FIVE_MIN_NS
+    codes, starts = pd.factorize(w_ns, sort=True)
+    nb = len(starts)
+    total = np.bincount(codes, minlength=nb)
+    c4 = np.bincount(codes, weights=is4, minlength=nb).astype(np.int64)
+    c5 = np.bincount(codes, weights=is5, minlength=nb).astype(np.int64)
+    return w_ns, np.asarray(starts), total, c4, c5
+
+
+def _window_start_ts(df: pd.DataFrame, start_ns: int) -> pd.Timestamp:
+    """Turn a bucketed epoch value back into a Timestamp in the input's tz."""
+    ts = pd.Timestamp(int(start_ns), unit="ns", tz="UTC")
+    tz = df["timestamp"].dt.tz
+    return ts.tz_convert(tz) if tz is not None else ts.tz_localize(None)
+
 
 # "Incident Detector"
 def peak_5xx_window_5m(df: pd.DataFrame, top_k_paths: int = 5) -> Optional[Dict[str, Any]]:
@@ -156,34 +319,34 @@ def peak_5xx_window_5m(df: pd.DataFrame, top_k_paths: int = 5) -> Optional[Dict[
     Find the 5-minute time window with the highest number of 5xx responses.
     Returns window timing, totals, and top failing endpoints, or None if no 5xx exist.
     """
-    if int(df["is_5xx"].sum()) == 0:
+    is5 = df["is_5xx"].to_numpy()
+    wc = _window_5m_counts(_epoch_ns(df["timestamp"]), df["is_4xx"].to_numpy(), is5)
+    return _peak_window_from_counts(df, wc, is5, top_k_paths=top_k_paths)
+
+
+def _peak_window_from_counts(
+    df: pd.DataFrame,
+    wc: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    is5: np.ndarray,
+    *,
+    top_k_paths: int,
+) -> Optional[Dict[str, Any]]:
+    w_ns, starts, total_w, c4_w, c5_w = wc
+    if len(starts) == 0 or c5_w.sum() == 0:
         return None
 
-    df2 = df.copy()
-    df2["window_5m"] = df2["timestamp"].dt.floor("5min")
+    i = int(np.argmax(c5_w))  # ties -> earliest window (starts is sorted)
+    peak_ns = int(starts[i])
+    total, c4, c5 = int(total_w[i]), int(c4_w[i]), int(c5_w[i])
+    peak_start = _window_start_ts(df, peak_ns)
 
-    # Count 5xx per window, choose the worst
-    g5 = df2.groupby("window_5m")["is_5xx"].sum().sort_values(ascending=False)
-    peak_start = g5.index[0]
-    peak_5xx = int(g5.iloc[0])
-
-    # Restrict to the peak window (all requests, not just 5xx)
-    in_window = df2["window_5m"] == peak_start
-    window_df = df2[in_window]
-
-    total = int(len(window_df))
-    c4 = int(window_df["is_4xx"].sum())
-    c5 = int(window_df["is_5xx"].sum())
-
-    # Top paths among the 5xx in this window
-    top_paths = []
-    failing = window_df[window_df["is_5xx"]]
-    if not failing.empty:
-        vc = failing["path"].value_counts().head(top_k_paths)
-        top_paths = [{"value": idx, "count": int(cnt)} for idx, cnt in vc.items()]
+    # Top paths among the 5xx in this window — the only part that still needs
+    # the rows themselves, and it only touches the in-window 5xx slice.
+    in_window = w_ns == peak_ns
+    top_paths = _top_n_filtered(df, in_window & is5, "path", n=top_k_paths)
 
     # Baseline traffic context for comparison (computed from full dataset)
-    baseline = traffic_baseline_5m(df)
+    baseline = _baseline_from_counts(total_w)
     typical_5m = baseline.get("typical_requests_5m", 0)
 
     return {
@@ -191,7 +354,7 @@ def peak_5xx_window_5m(df: pd.DataFrame, top_k_paths: int = 5) -> Optional[Dict[
         "window_end": _iso(peak_start + pd.Timedelta(minutes=5)),
         "total_requests": total,
         "4xx_count": c4,
-        "5xx_count": c5,  # should equal peak_5xx
+        "5xx_count": c5,  # equals the bincount winner by construction
         "5xx_rate": round(_safe_div(c5, total), 6),
         "top_5xx_paths": top_paths,
         "typical_requests_5m": typical_5m,
@@ -201,69 +364,178 @@ def peak_5xx_window_5m(df: pd.DataFrame, top_k_paths: int = 5) -> Optional[Dict[
 
 def requests_per_5m(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Return request counts per 5-minute window."""
-    window = df["timestamp"].dt.floor("5min")
-    counts = window.value_counts().sort_index()
-    return [{"window_start": idx.isoformat(), "requests": int(val)} for idx, val in counts.items()]
+    _, starts, total, _, _ = _window_5m_counts(
+        _epoch_ns(df["timestamp"]), df["is_4xx"].to_numpy(), df["is_5xx"].to_numpy()
+    )
+    # Format all window starts column-wise instead of one Timestamp at a time.
+    idx = pd.DatetimeIndex(starts.astype("datetime64[ns]")).tz_localize("UTC")
+    tz = df["timestamp"].dt.tz
+    if tz is None:
+        isos = list(idx.tz_localize(None).strftime("%Y-%m-%dT%H:%M:%S"))
+    else:
+        isos = _iso_all(idx.tz_convert(tz))
+    return [{"window_start": s, "requests": int(t)} for s, t in zip(isos, total)]
+
 
 def traffic_baseline_5m(df: pd.DataFrame) -> Dict[str, Any]:
     """
     Compute baseline traffic stats across 5-minute windows.
     Uses median as the 'typical' value (less sensitive to spikes).
     """
-    window = df["timestamp"].dt.floor("5min")
-    counts = window.value_counts()
+    wc = _window_5m_counts(
+        _epoch_ns(df["timestamp"]), df["is_4xx"].to_numpy(), df["is_5xx"].to_numpy()
+    )
+    return _baseline_from_counts(wc[2])
 
-    if counts.empty:
-        return {"typical_requests_5m": 0, "mean_requests_5m": 0.0, "p95_requests_5m": 0}
 
-    typical = int(counts.median())
-    mean = float(counts.mean())
-    p95 = int(counts.quantile(0.95))
+def _baseline_from_counts(counts: np.ndarray) -> Dict[str, Any]:
+    if len(counts) == 0:
+        return {"typical_requests_5m": 0, "mean_requests_5m": 0.0, "p95_requests_5m": 0}
 
     return {
-        "typical_requests_5m": typical,
-        "mean_requests_5m": round(mean, 3),
-        "p95_requests_5m": p95,
+        "typical_requests_5m": int(np.median(counts)),
+        "mean_requests_5m": round(float(counts.mean()), 3),
+        # np.quantile's default (linear) matches Series.quantile
+        "p95_requests_5m": int(np.quantile(counts, 0.95)),
         "num_windows_5m": int(len(counts)),
     }
 
 
 
+#: Below this row count the numpy/bincount path wins outright — backend
+#: conversion and thread-pool startup cost more than they save.
+_SMALL_MAX_ROWS = 50_000
+#: Above this row count duckdb's out-of-core engine is preferred over
+#: polars' in-memory one.
+_LARGE_MIN_ROWS = 5_000_000
+
+
 def compute_metrics(df: pd.DataFrame) -> Dict[str, Any]:
     """
     Compute the full v1 metrics bundle from a normalized event table.
     The returned dict is JSON-ready.
+
+    The backend is picked by input size: small frames run the numpy/bincount
+    implementations below (serially — parallelism doesn't pay there), medium
+    frames go to the polars backend, and very large frames to duckdb, with
+    each regime falling back to whichever backends are installed.
+
+    Accepts pandas, polars, and pyarrow event tables. Non-pandas input is
+    handed to the polars backend without a pandas round-trip (Arrow columns
+    are referenced in place); it only falls back to a pandas conversion
+    when polars is not installed.
     """
+    pl = metrics_polars.pl
+    if pl is not None and isinstance(df, pl.DataFrame):
+        return metrics_polars.compute_metrics_pl(df)
+    if pa is not None and isinstance(df, pa.Table):
+        if pl is not None:
+            return metrics_polars.compute_metrics_pl(pl.from_arrow(df, rechunk=False))
+        df = df.to_pandas()
+
     if df.empty:
         raise ValueError("compute_metrics() received an empty DataFrame")
 
+    if len(df) >= _SMALL_MAX_ROWS:
+        if len(df) >= _LARGE_MIN_ROWS and metrics_duckdb.available():
+            return metrics_duckdb.compute_metrics_duck(df)
+        if metrics_polars.available():
+            return metrics_polars.compute_metrics_pl(df)
+        if metrics_duckdb.available():
+            return metrics_duckdb.compute_metrics_duck(df)
+
+    # Dictionary-encode the high-repetition string columns once up front, so
+    # every downstream value_counts/groupby hashes small int codes instead of
+    # Python strings on every row. normalize_events usually did this already;
+    # the casts are no-ops then.
+    recast = {
+        c: df[c].astype("category")
+        for c in ("ip", "path")
+        if not isinstance(df[c].dtype, pd.CategoricalDtype)
+    }
+    if recast:
+        df = df.assign(**recast)
+
     start = df["timestamp"].min()
     end = df["timestamp"].max()
 
-    metrics: Dict[str, Any] = {
-        "meta": {
-            "start_time": _iso(start),
-            "end_time": _iso(end),
-            "total_requests": int(len(df)),
-            "unique_ips": int(df["ip"].nunique()),
-            "unique_paths": int(df["path"].nunique()),
-        },
-        "traffic": {
-            "requests_per_minute": requests_per_minute(df),
-            "top_paths_by_volume": top_paths_by_volume(df, n=10),
-	    "baseline_5m": traffic_baseline_5m(df),
-        },
-        "errors": {
-            "overall": overall_error_stats(df),
-            "errors_per_minute": errors_per_minute(df),
-            "top_5xx_paths": top_5xx_paths(df, n=10),
-            "peak_5xx_window_5m": peak_5xx_window_5m(df, top_k_paths=5),
-        },
-        "clients": {
-            "top_ips_by_requests": top_ips_by_requests(df, n=10),
-            "top_ips_by_5xx": top_ips_by_5xx(df, n=10, min_requests=20),
-            "top_ips_by_4xx": top_ips_by_4xx(df, n=10, min_requests=20),
-        },
-    }
+    # SoA: pull the hot columns out of the BlockManager as flat arrays once,
+    # then factorize each grouping once and share it — the per-minute series
+    # feed both time-series metrics, and the 5-minute window counts feed the
+    # baseline and the peak-window detector.
+    is4, is5 = _error_flags(df)
+    ts_ns = _epoch_ns(df["timestamp"])
+
+    # The remaining aggregations are independent of each other and spend
+    # their time in GIL-releasing pandas/numpy C loops, so run them on a
+    # small thread pool. Everything they read (the recast frame and the
+    # arrays above) is materialized before the pool and only read inside it.
+    # Small frames skip the pool: each aggregation finishes in microseconds
+    # there, below the cost of dispatching it to a thread.
+    pool = (
+        ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        if len(df) >= _SMALL_MAX_ROWS
+        else None
+    )
+
+    def _submit(fn, *args):
+        if pool is not None:
+            return pool.submit(fn, *args)
+        fut: Future = Future()
+        fut.set_result(fn(*args))
+        return fut
+
+    try:
+        f_minute = _submit(_per_minute_counts, df["minute"], is4, is5)
+        f_window = _submit(_window_5m_counts, ts_ns, is4, is5)
+        f_top_paths = _submit(top_paths_by_volume, df, 10)
+        f_5xx_paths = _submit(top_5xx_paths, df, 10)
+        f_ip_stats = _submit(_ip_stats, df, is4, is5)
+        f_unique_ips = _submit(df["ip"].nunique)
+        f_unique_paths = _submit(df["path"].nunique)
+
+        minutes, m_total, m_c4, m_c5 = f_minute.result()
+        wc = f_window.result()
+        minute_isos = _iso_all(minutes)  # shared by both time series below
+
+        # All three client lists come from the single _ip_stats pass: the
+        # min-request eligibility gate zeroes out ineligible IPs, which the
+        # top-N selection then drops along with the other zero counts.
+        ip_cats, ip_req, ip_c4, ip_c5 = f_ip_stats.result()
+        eligible = ip_req >= 20
+
+        metrics: Dict[str, Any] = {
+            "meta": {
+                "start_time": _iso(start),
+                "end_time": _iso(end),
+                "total_requests": int(len(df)),
+                "unique_ips": int(f_unique_ips.result()),
+                "unique_paths": int(f_unique_paths.result()),
+            },
+            "traffic": {
+                "requests_per_minute": [
+                    {"minute": m, "requests": int(t)} for m, t in zip(minute_isos, m_total)
+                ],
+                "top_paths_by_volume": f_top_paths.result(),
+                "baseline_5m": _baseline_from_counts(wc[2]),
+            },
+            "errors": {
+                "overall": _overall_from_flags(int(len(df)), is4, is5),
+                "errors_per_minute": [
+                    {"minute": m, "total": int(t), "4xx": int(a), "5xx": int(b)}
+                    for m, t, a, b in zip(minute_isos, m_total, m_c4, m_c5)
+                ],
+                "top_5xx_paths": f_5xx_paths.result(),
+                "peak_5xx_window_5m": _peak_window_from_counts(df, wc, is5, top_k_paths=5),
+            },
+            "clients": {
+                "top_ips_by_requests": _top_n_from_counts(ip_cats, ip_req, 10),
+                "top_ips_by_5xx": _top_n_from_counts(ip_cats, np.where(eligible, ip_c5, 0), 10),
+                "top_ips_by_4xx": _top_n_from_counts(ip_cats, np.where(eligible, ip_c4, 0), 10),
+            },
+        }
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     return metrics
@@ -0,0 +1,242 @@
+"""
+metrics_duckdb.py
+
+DuckDB backend for the metrics bundle in metrics.py.
+
+The metrics are classic OLAP — group-by-minute time series, top-N, windowed
+counts — over a single event table, which is exactly DuckDB's workload:
+in-process columnar engine, zero-copy pandas handoff via register(), hash
+aggregation and a parallel executor. On logs that dwarf RAM-friendly pandas
+frames this is the backend that keeps working.
+
+Optional, like the polars backend: compute_metrics() dispatches here only
+when duckdb imports. Output matches the other backends, with top-N lists
+ordered by (count desc, value asc).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import duckdb  # type: ignore
+except Exception:  # pragma: no cover
+    duckdb = None  # type: ignore
+
+
+#: Columns the metrics actually read; anything else is never registered.
+_EVENT_COLUMNS = ["timestamp", "ip", "path", "is_4xx", "is_5xx", "minute"]
+
+
+def available() -> bool:
+    """True when the duckdb backend can be used."""
+    return duckdb is not None
+
+
+def _iso(dt: Any) -> str:
+    return dt.isoformat()
+
+
+def _safe_div(n: int, d: int) -> float:
+    return float(n) / float(d) if d else 0.0
+
+
+def _top_list(rows: List[tuple]) -> List[Dict[str, Any]]:
+    """[{'value': ..., 'count': ...}] from (value, count) result rows."""
+    return [{"value": v, "count": int(c)} for v, c in rows]
+
+
+def compute_metrics_duck(events: pd.DataFrame) -> Dict[str, Any]:
+    """
+    DuckDB equivalent of metrics.compute_metrics: same inputs (a normalized
+    pandas event table), same JSON-ready output dict.
+    """
+    if duckdb is None:
+        raise RuntimeError("duckdb is not installed. Run: pip install duckdb")
+    if events.empty:
+        raise ValueError("compute_metrics() received an empty DataFrame")
+
+    ev = events[_EVENT_COLUMNS]
+    # Category codes don't register cleanly across duckdb versions; plain
+    # strings do, and the engine dictionary-encodes internally anyway.
+    ev = ev.assign(
+        **{
+            c: ev[c].astype(str)
+            for c in ("ip", "path")
+            if isinstance(ev[c].dtype, pd.CategoricalDtype)
+        }
+    )
+
+    con = duckdb.connect()
+    try:
+        # Registered tz-aware columns become TIMESTAMPTZ, which the client
+        # returns in the connection's TimeZone setting — the *system*
+        # timezone by default. Pin UTC so the _iso strings match the other
+        # backends on any machine.
+        con.execute("SET TimeZone = 'UTC'")
+        con.register("ev", ev)
+
+        (total, c4, c5, start, end, uips, upaths) = con.execute(
+            """
+            SELECT count(*), sum(is_4xx::INT), sum(is_5xx::INT),
+                   min(timestamp), max(timestamp),
+                   count(DISTINCT ip), count(DISTINCT path)
+            FROM ev
+            """
+        ).fetchone()
+        total, c4, c5 = int(total), int(c4), int(c5)
+
+        per_minute = con.execute(
+            """
+            SELECT minute, count(*) AS total,
+                   sum(is_4xx::INT) AS c4xx, sum(is_5xx::INT) AS c5xx
+            FROM ev GROUP BY 1 ORDER BY 1
+            """
+        ).fetchall()
+
+        top_paths = con.execute(
+            "SELECT path, count(*) AS c FROM ev"
+            " GROUP BY 1 ORDER BY c DESC, path ASC LIMIT 10"
+        ).fetchall()
+
+        top_5xx_paths = con.execute(
+            "SELECT path, count(*) AS c FROM ev WHERE is_5xx"
+            " GROUP BY 1 ORDER BY c DESC, path ASC LIMIT 10"
+        ).fetchall()
+
+        top_ips = con.execute(
+            "SELECT ip, count(*) AS c FROM ev"
+            " GROUP BY 1 ORDER BY c DESC, ip ASC LIMIT 10"
+        ).fetchall()
+
+        # min_requests=20 eligibility on total traffic, ranked by error count.
+        top_ips_5xx = con.execute(
+            """
+            SELECT ip, sum(is_5xx::INT) AS c FROM ev
+            GROUP BY 1 HAVING count(*) >= 20 AND c > 0
+            ORDER BY c DESC, ip ASC LIMIT 10
+            """
+        ).fetchall()
+        top_ips_4xx = con.execute(
+            """
+            SELECT ip, sum(is_4xx::INT) AS c FROM ev
+            GROUP BY 1 HAVING count(*) >= 20 AND c > 0
+            ORDER BY c DESC, ip ASC LIMIT 10
+            """
+        ).fetchall()
+
+        per_window = con.execute(
+            """
+            SELECT time_bucket(INTERVAL 5 MINUTE, timestamp) AS w,
+                   count(*) AS total,
+                   sum(is_4xx::INT) AS c4xx, sum(is_5xx::INT) AS c5xx
+            FROM ev GROUP BY 1 ORDER BY 1
+            """
+        ).fetchall()
+
+        baseline = _baseline_5m(con)
+        peak = _peak_window(con, per_window, baseline, top_k_paths=5)
+    finally:
+        con.close()
+
+    return {
+        "meta": {
+            "start_time": _iso(start),
+            "end_time": _iso(end),
+            "total_requests": total,
+            "unique_ips": int(uips),
+            "unique_paths": int(upaths),
+        },
+        "traffic": {
+            "requests_per_minute": [
+                {"minute": _iso(m), "requests": int(t)} for m, t, _, _ in per_minute
+            ],
+            "top_paths_by_volume": _top_list(top_paths),
+            "baseline_5m": baseline,
+        },
+        "errors": {
+            "overall": {
+                "total_requests": total,
+                "4xx_count": c4,
+                "5xx_count": c5,
+                "4xx_rate": round(_safe_div(c4, total), 6),
+                "5xx_rate": round(_safe_div(c5, total), 6),
+            },
+            "errors_per_minute": [
+                {"minute": _iso(m), "total": int(t), "4xx": int(a), "5xx": int(b)}
+                for m, t, a, b in per_minute
+            ],
+            "top_5xx_paths": _top_list(top_5xx_paths),
+            "peak_5xx_window_5m": peak,
+        },
+        "clients": {
+            "top_ips_by_requests": _top_list(top_ips),
+            "top_ips_by_5xx": _top_list(top_ips_5xx),
+            "top_ips_by_4xx": _top_list(top_ips_4xx),
+        },
+    }
+
+
+def _baseline_5m(con: "duckdb.DuckDBPyConnection") -> Dict[str, Any]:
+    """Baseline traffic stats over per-5-minute-window totals."""
+    row = con.execute(
+        """
+        WITH w AS (
+            SELECT count(*) AS total
+            FROM ev GROUP BY time_bucket(INTERVAL 5 MINUTE, timestamp)
+        )
+        SELECT quantile_cont(total, 0.5), avg(total),
+               quantile_cont(total, 0.95), count(*)
+        FROM w
+        """
+    ).fetchone()
+    if row is None or row[3] == 0:
+        return {"typical_requests_5m": 0, "mean_requests_5m": 0.0, "p95_requests_5m": 0}
+    return {
+        "typical_requests_5m": int(row[0]),
+        "mean_requests_5m": round(float(row[1]), 3),
+        "p95_requests_5m": int(row[2]),
+        "num_windows_5m": int(row[3]),
+    }
+
+
+def _peak_window(
+    con: "duckdb.DuckDBPyConnection",
+    per_window: List[tuple],
+    baseline: Dict[str, Any],
+    *,
+    top_k_paths: int,
+) -> Optional[Dict[str, Any]]:
+    """The 5-minute window with the most 5xx, or None when no 5xx exist."""
+    if not per_window:
+        return None
+    peak_start, total, c4, c5 = min(per_window, key=lambda r: (-int(r[3]), r[0]))
+    total, c4, c5 = int(total), int(c4), int(c5)
+    if c5 == 0:
+        return None
+
+    top_paths = _top_list(
+        con.execute(
+            """
+            SELECT path, count(*) AS c FROM ev
+            WHERE is_5xx AND time_bucket(INTERVAL 5 MINUTE, timestamp) = ?
+            GROUP BY 1 ORDER BY c DESC, path ASC LIMIT ?
+            """,
+            [peak_start, top_k_paths],
+        ).fetchall()
+    )
+
+    typical_5m = baseline.get("typical_requests_5m", 0)
+    return {
+        "window_start": _iso(peak_start),
+        "window_end": _iso(peak_start + pd.Timedelta(minutes=5)),
+        "total_requests": total,
+        "4xx_count": c4,
+        "5xx_count": c5,
+        "5xx_rate": round(_safe_div(c5, total), 6),
+        "top_5xx_paths": top_paths,
+        "typical_requests_5m": typical_5m,
+        "traffic_multiplier_vs_typical": round(total / typical_5m, 3) if typical_5m else None,
+    }